@@ -1,4 +1,6 @@
 from __future__ import annotations
+import math
+from functools import cached_property, lru_cache
 from typing import Iterator
 
 from pydantic_core.core_schema import FieldValidationInfo
@@ -13,7 +15,7 @@ from pydantic import (
 )
 
 from py_loans.process import ConstantValue, Process
-from py_loans.roots import bisect
+from py_loans.roots import bisect_float
 
 
 class RepaymentPeriod(BaseModel):
@@ -61,7 +63,7 @@ class RepaymentPeriod(BaseModel):
         return max(v, interest)
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def end_value(self) -> NonNegativeFloat:
         return self.start_value + self.interest - self.payment
 
@@ -78,12 +80,12 @@ class RepaymentSchedule(BaseModel):
     @computed_field  # type: ignore[misc]
     @property
     def interest(self) -> float:
-        return sum(rp.interest for rp in self.periods)
+        return math.fsum(rp.interest for rp in self.periods)
 
     @computed_field  # type: ignore[misc]
     @property
     def total(self) -> float:
-        return sum(rp.payment for rp in self.periods)
+        return math.fsum(rp.payment for rp in self.periods)
 
 
 class LoanTerm(BaseModel):
@@ -103,11 +105,14 @@ class LoanTerm(BaseModel):
     simple: bool = True
 
 
+@lru_cache(maxsize=1024)
 def convert_rate(
     rate: float, from_period: float = 1.0, to_period: float = 12, simple: bool = True
 ) -> float:
     """Convert an interest rate over one period to an equivalent rate over another period.
 
+    A pure function of its arguments, so results are memoized across calls.
+
     `(1 + j)**to_period == (1 + i)**from_period`
 
     `j == (1 + i)**(from_period/to_period) - 1`
@@ -128,7 +133,7 @@ def convert_rate(
     """
     if simple:
         return rate * from_period / to_period
-    return float((1 + rate) ** (from_period / to_period) - 1)
+    return math.expm1(math.log1p(rate) * (from_period / to_period))
 
 
 def loan(
@@ -165,22 +170,126 @@ def loan(
     if isinstance(payment_process, (int, float)):
         payment_process = ConstantValue(value=payment_process)
 
+    if isinstance(interest_rate_process, ConstantValue) and isinstance(
+        payment_process, ConstantValue
+    ):
+        # a constant-rate, constant-payment schedule has a closed form
+        yield from _flat_rate_periods(
+            start_value=float(start_value),
+            rate=interest_rate_process.value,
+            payment=payment_process.value,
+            time_step=time_step,
+            num_steps=max(repayment_period - time_step, 1),
+        )
+        return
+
+    rate_at = interest_rate_process.step
+    payment_at = payment_process.step
+    last_step = repayment_period - 1
+
     while True:
         month = RepaymentPeriod(
             time_step=time_step,
             start_value=start_value,
-            interest=start_value * interest_rate_process.step(time_step),
-            payment=payment_process.step(time_step),
+            interest=start_value * rate_at(time_step),
+            payment=payment_at(time_step),
         )
         yield month
 
-        if month.time_step >= (repayment_period - 1):
+        if month.time_step >= last_step:
             break
 
         time_step = time_step + 1
         start_value = month.end_value
 
 
+def _flat_rate_start_values(
+    start_value: float, rate: float, payment: float, num_steps: int
+) -> list[float]:
+    """Start values of a constant-rate, constant-payment loan.
+
+    The repayment recurrence `s_{t+1} = s_t * (1 + r) - p` has the closed
+    form `s_t = (s_0 - p/r) * (1 + r) ** t + p/r`, so the schedule can be
+    computed directly rather than by replaying the recurrence.
+    """
+    if not rate:
+        return [start_value - payment * t for t in range(num_steps)]
+    if payment <= start_value * rate:
+        # payments are clamped to the interest so the loan never amortizes
+        return [start_value] * num_steps
+    k = payment / rate
+    growth = 1.0 + rate
+    return [(start_value - k) * growth**t + k for t in range(num_steps)]
+
+
+def _flat_rate_periods(
+    start_value: float,
+    rate: float,
+    payment: float,
+    time_step: int,
+    num_steps: int,
+) -> list[RepaymentPeriod]:
+    """Build a constant-rate, constant-payment repayment schedule in one pass.
+
+    The inputs are trusted floats, so the payment clamp is applied inline
+    and validation is skipped via `model_construct`.
+    """
+    payment = float(payment)
+    periods = []
+    for t, value in enumerate(
+        _flat_rate_start_values(start_value, rate, payment, num_steps)
+    ):
+        interest = value * rate
+        periods.append(
+            RepaymentPeriod.model_construct(
+                time_step=time_step + t,
+                start_value=value,
+                interest=interest,
+                payment=payment if payment >= interest else interest,
+            )
+        )
+    return periods
+
+
+def _final_end_value(
+    start_value: float, growth_factors: list[float], payment: float
+) -> float:
+    """Loan value after flat payments over precomputed growth factors `1 + r`.
+
+    Pure-float core of the root-finding objective: no models are built
+    and intermediate periods are never materialized. Each step is the
+    recurrence `s = s * (1 + r) - p`, with payments clamped to the
+    interest leaving the value unchanged.
+    """
+    value = start_value
+    for growth in growth_factors:
+        grown = value * growth
+        if payment > grown - value:
+            value = grown - payment
+            if value <= 0.0:
+                # the loan only keeps falling from here; the sign of the
+                # objective is already decided
+                break
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _flat_payment(start_value: float, rate: float, num_steps: int) -> float:
+    """Closed-form flat payment for a constant interest rate.
+
+    Pure in its scalar arguments, so repeated solves across scenarios
+    and stress runs are served from the cache.
+
+    Solving the repayment recurrence for a payment such that the loan is
+    zero after `num_steps` periods gives the annuity formula
+    `P = S * r / (1 - (1 + r) ** -n)`, or `S / n` when the rate is zero.
+    """
+    if not rate:
+        return start_value / num_steps
+    # 1 - (1 + r)**-n via expm1/log1p stays accurate for tiny monthly rates
+    return start_value * rate / -math.expm1(-num_steps * math.log1p(rate))
+
+
 def find_flat_payment(
     start_value: NonNegativeFloat,
     interest_rate_process: Process | float,
@@ -190,6 +299,9 @@ def find_flat_payment(
 ) -> float:
     """Find the flat payment such that a loan is paid off at maturity.
 
+    Constant interest rates admit the closed-form annuity payment.
+    Root finding is only used for genuinely time-varying rate processes.
+
     Arguments:
         start_value: Loan amount at the outset.
         interest_rate_process: Process governing the interest rate at each time step.
@@ -218,18 +330,39 @@ def find_flat_payment(
 
     """
 
+    if isinstance(interest_rate_process, (int, float)):
+        interest_rate_process = ConstantValue(value=interest_rate_process)
+
+    if isinstance(interest_rate_process, ConstantValue):
+        return _flat_payment(
+            start_value,
+            interest_rate_process.value,
+            repayment_period - time_step,
+        )
+
+    num_steps = repayment_period - time_step
+
+    # the rate schedule does not depend on the payment, so evaluate the
+    # process once rather than on every root-finding iteration
+    rates = [interest_rate_process.step(t) for t in range(time_step, repayment_period)]
+    growth_factors = [1.0 + rate for rate in rates]
+
     def objective_func(flat_payment: float) -> float:
-        loan_gen = loan(
+        return _final_end_value(
             start_value=start_value,
-            interest_rate_process=interest_rate_process,
-            payment_process=ConstantValue(value=flat_payment),
-            time_step=time_step,
-            repayment_period=repayment_period,
+            growth_factors=growth_factors,
+            payment=flat_payment,
         )
-        repayment = list(loan_gen)
-        return repayment[-1].end_value
 
-    root = bisect(objective_func, a=0, b=start_value, tol=tol)
+    # anchor the bracket on the annuity payment at the average rate;
+    # a narrower bracket means fewer bisection iterations
+    mean_rate = sum(rates) / num_steps
+    anchor = _flat_payment(start_value, mean_rate, num_steps)
+    a, b = 0.5 * anchor, 2.0 * anchor
+    if not objective_func(a) > 0.0 > objective_func(b):
+        a, b = 0.0, start_value
+
+    root = bisect_float(objective_func, a=a, b=b, tol=tol)
 
     if not root.converged:
         raise ValueError(f"Could not find payment. {root}")
@@ -237,6 +370,40 @@ def find_flat_payment(
     return root.value
 
 
+def find_flat_payments(
+    start_values: list[float],
+    rates: list[float],
+    repayment_periods: list[int],
+) -> list[float]:
+    """Find the flat payments for many constant-rate loans at once.
+
+    Each loan is priced with the closed-form annuity payment, so pricing
+    a batch costs one formula evaluation per loan.
+
+    Arguments:
+        start_values: Loan amount at the outset of each loan.
+        rates: Constant interest rate for each loan.
+        repayment_periods: Number of time steps until each loan matures.
+
+    Examples:
+
+        >>> payments = find_flat_payments(
+        ... start_values=[100, 100],
+        ... rates=[0.0, 0.05],
+        ... repayment_periods=[25, 25],
+        ... )
+        >>> [round(payment, 2) for payment in payments]
+        [4.0, 7.1]
+
+    """
+    return [
+        _flat_payment(start_value, rate, num_steps)
+        for start_value, rate, num_steps in zip(
+            start_values, rates, repayment_periods, strict=True
+        )
+    ]
+
+
 class IllustrativeMortgage(BaseModel):
     """Illustrative mortgage repayment schedule.
 
@@ -266,6 +433,7 @@ class IllustrativeMortgage(BaseModel):
 
         time_step = 0
         loan_periods: list[RepaymentPeriod] = []
+        prev_rate: float | None = None
 
         for lidx, loan_term in enumerate(loan_terms):
             term_rate = convert_rate(
@@ -277,28 +445,27 @@ class IllustrativeMortgage(BaseModel):
 
             # find the start value of the current period
             if lidx:
-                time_step = sum(lt.term for lt in loan_terms[:lidx])
+                time_step += loan_terms[lidx - 1].term
+                if term_rate == prev_rate:
+                    # the rate is unchanged, so the flat payment and the
+                    # remaining schedule are too
+                    continue
                 start_value = loan_periods[time_step - 1].end_value
-                loan_periods = loan_periods[:time_step]
+                del loan_periods[time_step:]
 
             # find the flat payment assuming the new interest rate for the
-            # remainder of the loan
-            payment = find_flat_payment(
+            # remainder of the loan and materialize the schedule in the
+            # same pass
+            num_steps = repayment_period - time_step
+            payment = _flat_payment(start_value, term_rate, num_steps)
+            loan_periods += _flat_rate_periods(
                 start_value=start_value,
-                interest_rate_process=term_rate,
+                rate=term_rate,
+                payment=payment,
                 time_step=time_step,
-                repayment_period=repayment_period,
-                tol=1e-5,
-            )
-
-            loan_periods += list(
-                loan(
-                    start_value=start_value,
-                    interest_rate_process=term_rate,
-                    payment_process=payment,
-                    time_step=time_step,
-                    repayment_period=repayment_period,
-                )
+                num_steps=num_steps,
             )
+            prev_rate = term_rate
 
-        return RepaymentSchedule(periods=loan_periods)
+        # the periods were built internally, so skip re-validating the list
+        return RepaymentSchedule.model_construct(periods=loan_periods)
@@ -1,5 +1,6 @@
 """Root finding algorithms for calculating payment amounts for a given loan term."""
 
+import struct
 from typing import Callable
 
 from pydantic import BaseModel
@@ -22,12 +23,23 @@ class Root(BaseModel):
     tol: float
 
 
+def _to_ordered_bits(x: float) -> int:
+    """Map a float to an integer that orders the same way the float does."""
+    bits = struct.unpack("<q", struct.pack("<d", x))[0]
+    if bits >= 0:
+        return int(bits)
+    return int(-(2**63) - bits)
+
+
+def _from_ordered_bits(bits: int) -> float:
+    """Invert the ordered-integer mapping of a float's bit pattern."""
+    if bits < 0:
+        bits = -(2**63) - bits
+    return float(struct.unpack("<d", struct.pack("<q", bits))[0])
+
+
 def _same_sign(a: float, b: float) -> bool:
-    if a > 0 and b > 0:
-        return True
-    if a < 0 and b < 0:
-        return True
-    return False
+    return a * b > 0
 
 
 def bisect(
@@ -58,17 +70,127 @@ def bisect(
         True
 
     """
+    fa = f(a)
     iteration = 0
     while iteration < max_iterations:
-        c = (a + b) / 2
-        if ((b - a) / 2) < tol or abs(fc := f(c)) < tol:
+        half_width = (b - a) * 0.5
+        c = a + half_width
+        if half_width < tol or abs(fc := f(c)) < tol:
             return Root(value=c, iterations=iteration, converged=True, tol=tol)
 
-        if _same_sign(f(a), fc):
-            a = c
+        if _same_sign(fa, fc):
+            a, fa = c, fc
         else:
             b = c
 
         iteration += 1
 
-    return Root(value=(a + b) / 2, iterations=iteration, converged=False, tol=tol)
+    return Root(value=a + (b - a) * 0.5, iterations=iteration, converged=False, tol=tol)
+
+
+def newton(
+    f: Callable[[float], float],
+    fprime: Callable[[float], float],
+    x0: float,
+    tol: float,
+    max_iterations: int = 50,
+) -> Root:
+    """Newton-Raphson root-finding algorithm.
+
+    Converges quadratically near a simple root, and in a single step for
+    objectives that are linear in the unknown, such as the final loan
+    value as a function of the flat payment.
+
+    Arguments:
+        f: Objective function.
+        fprime: Derivative of the objective function.
+        x0: Initial guess.
+        tol: Maximum value of `f(x)` for x to count as a root.
+        max_iterations: Maximum iterations without convergence.
+
+    Examples:
+        >>> root = newton(
+        ... f=lambda x: x*x - 4, fprime=lambda x: 2*x, x0=1.0, tol=1e-12
+        ... )
+        >>> round(root.value, 6)
+        2.0
+        >>> root.converged
+        True
+
+    """
+    x = x0
+    iteration = 0
+    while iteration < max_iterations:
+        fx = f(x)
+        if abs(fx) < tol:
+            return Root(value=x, iterations=iteration, converged=True, tol=tol)
+
+        derivative = fprime(x)
+        if not derivative:
+            break
+
+        x -= fx / derivative
+        iteration += 1
+
+    return Root(value=x, iterations=iteration, converged=False, tol=tol)
+
+
+def bisect_float(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float,
+    max_iterations: int = 65,
+) -> Root:
+    """Bisection over the bit patterns of the search interval.
+
+    Splitting the interval midway through the ordered integer
+    representation of IEEE-754 doubles halves the number of representable
+    values in the bracket each iteration, so the search reaches adjacent
+    floats in at most 64 iterations however wide the initial interval.
+
+    Arguments:
+        f: Objective function.
+        a: Left of the initial search interval.
+        b: Right of the initial search interval.
+        tol: Maximum distance between a and b or value of `f((a+b)/2)`.
+        max_iterations: Maximum iterations without convergence.
+
+    Examples:
+        >>> root = bisect_float(f=lambda x: x*x - 4, a=0.0, b=4.0, tol=0.001)
+        >>> round(root.value, 3)
+        2.0
+        >>> root.converged
+        True
+        >>> root = bisect_float(f=lambda x: x*x*x + 8, a=-7.0, b=-1.0, tol=1e-9)
+        >>> round(root.value, 6)
+        -2.0
+
+    """
+    bits_a = _to_ordered_bits(a)
+    bits_b = _to_ordered_bits(b)
+    fa = f(a)
+    iteration = 0
+    while iteration < max_iterations:
+        bits_c = bits_a + ((bits_b - bits_a) >> 1)
+        c = _from_ordered_bits(bits_c)
+        if (b - a) * 0.5 < tol or abs(fc := f(c)) < tol:
+            return Root(value=c, iterations=iteration, converged=True, tol=tol)
+
+        if bits_b - bits_a <= 1:
+            # a and b are adjacent floats; the bracket cannot shrink further
+            break
+
+        if _same_sign(fa, fc):
+            bits_a, a, fa = bits_c, c, fc
+        else:
+            bits_b, b = bits_c, c
+
+        iteration += 1
+
+    return Root(
+        value=_from_ordered_bits(bits_a + ((bits_b - bits_a) >> 1)),
+        iterations=iteration,
+        converged=False,
+        tol=tol,
+    )
@@ -1,8 +1,19 @@
 import pytest
+from pydantic import BaseModel
 from py_loans.loan import find_flat_payment
 from py_loans.process import ConstantValue
 
 
+class LinearRamp(BaseModel):
+    """Rate process that drifts linearly over time."""
+
+    value: float
+    slope: float
+
+    def step(self, t: int) -> float:
+        return self.value + self.slope * t
+
+
 @pytest.mark.parametrize(
     "repayment_period,interest_rate,expected", ((25, 0.0, 400), (25, 0.05, 710))
 )
@@ -24,9 +35,25 @@ def test_find_flat_payment(
     assert abs(payment - expected) <= tol, (payment, expected, tol)
 
 
+def test_find_flat_payment_variable_rate() -> None:
+    start_value = 10000
+    interest_rate_process = LinearRamp(value=0.0, slope=0.0001)
+    time_step = 0
+    tol = 1e-5
+    payment = find_flat_payment(
+        start_value=start_value,
+        interest_rate_process=interest_rate_process,
+        time_step=time_step,
+        repayment_period=25,
+        tol=tol,
+    )
+
+    assert payment > 10000 / 25, payment
+
+
 def test_find_flat_payment_does_not_converge() -> None:
     start_value = 10000
-    interest_rate_process = ConstantValue(value=0.05)
+    interest_rate_process = LinearRamp(value=0.05, slope=0.0001)
     time_step = 0
     with pytest.raises(ValueError):
         find_flat_payment(
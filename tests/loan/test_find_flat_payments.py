@@ -0,0 +1,35 @@
+import pytest
+
+from py_loans.loan import find_flat_payment, find_flat_payments
+
+
+def test_find_flat_payments_matches_scalar() -> None:
+    start_values = [10000.0, 10000.0, 240000.0]
+    rates = [0.0, 0.05, 0.0042]
+    repayment_periods = [25, 25, 300]
+
+    payments = find_flat_payments(
+        start_values=start_values,
+        rates=rates,
+        repayment_periods=repayment_periods,
+    )
+
+    expected = [
+        find_flat_payment(
+            start_value=start_value,
+            interest_rate_process=rate,
+            repayment_period=repayment_period,
+        )
+        for start_value, rate, repayment_period in zip(
+            start_values, rates, repayment_periods
+        )
+    ]
+
+    assert payments == expected, payments
+
+
+def test_find_flat_payments_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        find_flat_payments(
+            start_values=[100.0], rates=[0.05, 0.05], repayment_periods=[25]
+        )
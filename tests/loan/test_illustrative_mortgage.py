@@ -30,6 +30,30 @@ def test_illustrative_mortgage() -> None:
     assert round(repayment.total) == expected_total
 
 
+def test_illustrative_mortgage_repeated_term_rate() -> None:
+    start_value = 240_000
+    repayment_period = 300
+    split = IllustrativeMortgage(
+        start_value=start_value,
+        loan_terms=[
+            LoanTerm(rate=0.0519, term=12),
+            LoanTerm(rate=0.0519, term=12),
+            LoanTerm(rate=0.0779, term=1),
+        ],
+        repayment_period=repayment_period,
+    ).calculate()
+    merged = IllustrativeMortgage(
+        start_value=start_value,
+        loan_terms=[
+            LoanTerm(rate=0.0519, term=24),
+            LoanTerm(rate=0.0779, term=1),
+        ],
+        repayment_period=repayment_period,
+    ).calculate()
+
+    assert [rp.payment for rp in split.periods] == [rp.payment for rp in merged.periods]
+
+
 def test_illustrative_mortgage_3_terms() -> None:
     start_value = 240_000
     repayment_period = 300
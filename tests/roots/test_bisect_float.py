@@ -0,0 +1,36 @@
+from py_loans.roots import bisect_float
+
+
+def test_bisect_float() -> None:
+    def objective_func(x: float) -> float:
+        return x * x - 4
+
+    a = 0.0
+    b = 4.0
+    tol = 1e-4
+    expected = 2
+
+    root = bisect_float(f=objective_func, a=a, b=b, tol=tol)
+
+    assert abs(root.value - expected) < tol, root
+    assert root.converged, root
+
+
+def test_bisect_float_negative_bracket() -> None:
+    def objective_func(x: float) -> float:
+        return x * x * x + 8
+
+    root = bisect_float(f=objective_func, a=-7.0, b=-1.0, tol=1e-9)
+
+    assert abs(root.value - -2) < 1e-9, root
+    assert root.converged, root
+
+
+def test_bisect_float_bounded_iterations() -> None:
+    def objective_func(x: float) -> float:
+        return x - 1e-30
+
+    root = bisect_float(f=objective_func, a=0.0, b=1e300, tol=0.0)
+
+    assert not root.converged, root
+    assert root.iterations <= 65, root
@@ -0,0 +1,41 @@
+from py_loans.roots import newton
+
+
+def test_newton() -> None:
+    def objective_func(x: float) -> float:
+        return x * x - 4
+
+    def derivative(x: float) -> float:
+        return 2 * x
+
+    tol = 1e-10
+
+    root = newton(f=objective_func, fprime=derivative, x0=1.0, tol=tol)
+
+    assert abs(root.value - 2) < tol, root
+    assert root.converged, root
+
+
+def test_newton_linear_objective_converges_in_one_step() -> None:
+    def objective_func(x: float) -> float:
+        return 3 * x - 6
+
+    def derivative(x: float) -> float:
+        return 3.0
+
+    root = newton(f=objective_func, fprime=derivative, x0=100.0, tol=1e-10)
+
+    assert root.value == 2, root
+    assert root.iterations == 1, root
+
+
+def test_newton_zero_derivative_does_not_converge() -> None:
+    def objective_func(x: float) -> float:
+        return x * x + 1
+
+    def derivative(x: float) -> float:
+        return 0.0
+
+    root = newton(f=objective_func, fprime=derivative, x0=1.0, tol=1e-10)
+
+    assert not root.converged, root